@@ -39,6 +39,28 @@ class Matrix(Device):
         if display:
             self._output()
 
+    def set_pixels_raw(self, buf, display=True):
+        """Write packed pixel data to LED matrix
+
+        :param buf: 18 bytes of colour (0–10) and brightness (0–10) pairs, in the same order as set_pixels
+        :param display: Whether to update matrix or not
+        :raises MatrixError: Occurs if invalid buffer length or pixel value provided
+        """
+        try:
+            data = memoryview(buf)
+            if data.itemsize != 1:
+                raise MatrixError("Invalid buffer specified, expected bytes")
+            data = data.cast('B')
+        except TypeError:
+            raise MatrixError("Invalid buffer specified") from None
+        if len(data) != 18:
+            raise MatrixError("Incorrect buffer length")
+        if max(data) > 10:
+            raise MatrixError("Invalid pixel value specified")
+        self._matrix = [[(data[6 * x + 2 * y], data[6 * x + 2 * y + 1]) for y in range(3)] for x in range(3)]
+        if display:
+            self._output()
+
     def _output(self):
         out = [0xc2]
         for x in range(3):
@@ -239,12 +239,12 @@ class BuildHAT:
         :return: Checksum that has been calculated
         """
         u = 1
-        for i in range(0, len(data)):
+        for byte in data:
             if (u & 0x80000000) != 0:
                 u = (u << 1) ^ 0x1d872b41
             else:
                 u = u << 1
-            u = (u ^ data[i]) & 0xFFFFFFFF
+            u = (u ^ byte) & 0xFFFFFFFF
         return u
 
     def write(self, data, log=True, replace=""):
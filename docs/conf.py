@@ -3,7 +3,6 @@
 
 import sys
 import os
-from collections import OrderedDict
 
 sys.path.insert(0, os.path.abspath('.'))
 
@@ -15,9 +14,9 @@ PORT = 'hub'
 VERSION = 'latest'
 
 tags.add('port_' + PORT)
-ports = OrderedDict((
-    ('hub', 'the Build HAT'),
-))
+ports = {
+    'hub': 'the Build HAT',
+}
 
 # The members of the html_context dict are available inside
 # topindex.html
@@ -11,16 +11,14 @@
     :license: MIT, see LICENSE for details
 """
 
-import codecs
 import re
 from docutils import nodes
 from sphinx.util.nodes import nested_parse_with_titles
 from docutils.statemachine import ViewList
 from docutils.parsers.rst import Directive
 
-re_comment = re.compile("^\s?/\*\*\**(.*)$")
-re_cmtnext = re.compile("^[/\* | \*]?\**(.*)$")
-re_cmtend = re.compile("(.*)(\*/)+$")
+re_comment = re.compile(r"^[ \t]*/\*\*+(.*?)\s*$", re.ASCII)
+re_cmtend = re.compile(r"(.*)(\*/)+$", re.ASCII)
 
 
 class ExtractError(Exception):
@@ -36,6 +34,7 @@ class Extractor(object):
         """
         """
         self.content = ViewList("", 'comment')
+        self._buf = []
         self.lineno = 0
         self.is_multiline = False
 
@@ -44,28 +43,32 @@ class Extractor(object):
         Process the source file and fill in the content.
         SOURCE is a fileobject.
         """
-        for l in source:
-            self.lineno = self.lineno + 1
-            l = l.strip()
-            m = re_comment.match(l)
+        match = re_comment.match
+        # Read everything at once; comment() consumes from the same iterator
+        lines = enumerate(source.read().splitlines(), self.lineno + 1)
+        for self.lineno, l in lines:
+            m = match(l)
 
             if (m):
-                self.comment(m.group(1), source, prefix)
+                self.comment(m.group(1), lines, prefix)
+
+        self.content = ViewList(self._buf, "comment")
 
     def comment(self, cur, source, prefix):
         """
         Read the whole comment and strip the stars.
 
-        CUR is currently read line and SOURCE is a fileobject
-        with the source code.
+        CUR is currently read line and SOURCE is an iterator of
+        (line number, line) pairs over the remaining source lines.
         """
-        self.content.append(cur.strip(), "comment")
+        append = self._buf.append
+        cmtend = re_cmtend.match
+        append(cur.strip())
 
-        for line in source:
-            self.lineno = self.lineno + 1
+        for self.lineno, line in source:
             # line = line.strip()
 
-            if re_cmtend.match(line):
+            if cmtend(line):
                 if (not self.is_multiline):
                     break
                 else:
@@ -80,7 +83,7 @@ class Extractor(object):
                     continue
 
             if line.startswith(".. "):
-                self.content.append(line, "comment")
+                append(line)
                 continue
 
             if line.startswith("\code"):
@@ -94,16 +97,12 @@ class Extractor(object):
             if line.startswith("/"):
                 line = "/" + line
 
-            m = re_cmtnext.match(line)
-            if m:
-#               self.content.append("    " + m.group(1).strip(), "comment")
-#               self.content.append("" + m.group(1), "comment")
-                self.content.append(prefix + m.group(1), "comment")
-                continue
-
-            self.content.append(line.strip(), "comment")
+            # Drop one leading comment character, then any run of stars
+            if line and line[0] in "/* |":
+                line = line[1:]
+            append(prefix + line.lstrip("*"))
 
-        self.content.append('\n', "comment")
+        append('\n')
 
 
 class CmtIncDirective(Directive):
@@ -138,9 +137,8 @@ class CmtIncDirective(Directive):
             try:
                 encoding = self.options.get('encoding',
                                             self.env.config.source_encoding)
-                codecinfo = codecs.lookup(encoding)
-                f = codecs.StreamReaderWriter(
-                    open(filename, 'rb'), codecinfo[2], codecinfo[3], 'strict')
+                f = open(filename, 'r', encoding=encoding,
+                         buffering=128 * 1024)
                 extr.extract(f, prefix)
             except (IOError, OSError):
                 return [
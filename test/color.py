@@ -8,9 +8,19 @@ from buildhat import ColorSensor
 class TestColor(unittest.TestCase):
     """Test color sensor functions"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Claim the sensor once for all tests"""
+        cls._color = ColorSensor('A')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the sensor's port"""
+        del cls._color
+
     def test_color_interval(self):
         """Test color sensor interval"""
-        color = ColorSensor('A')
+        color = self._color
         color.avg_reads = 1
         color.interval = 10
         count = 1000
@@ -32,7 +42,7 @@ class TestColor(unittest.TestCase):
 
     def test_caching(self):
         """Test to make sure we're not reading cached data"""
-        color = ColorSensor('A')
+        color = self._color
         color.avg_reads = 1
         color.interval = 1
 
@@ -9,22 +9,36 @@ from buildhat.exc import DeviceError
 class TestDistance(unittest.TestCase):
     """Test distance sensor"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Claim the sensor once for all tests"""
+        cls._dist = DistanceSensor('A')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the sensor's port"""
+        del cls._dist
+
     def test_properties(self):
         """Test properties of sensor"""
-        d = DistanceSensor('A')
+        d = self._dist
         self.assertIsInstance(d.distance, int)
         self.assertIsInstance(d.threshold_distance, int)
 
     def test_distance(self):
         """Test obtaining distance"""
-        d = DistanceSensor('A')
+        d = self._dist
         self.assertIsInstance(d.get_distance(), int)
 
     def test_eyes(self):
         """Test lighting LEDs on sensor"""
-        d = DistanceSensor('A')
+        d = self._dist
         d.eyes(100, 100, 100, 100)
 
+
+class TestDistancePort(unittest.TestCase):
+    """Test claiming and releasing a distance sensor's port"""
+
     def test_duplicate_port(self):
         """Test using same port"""
         d = DistanceSensor('A')  # noqa: F841
@@ -10,9 +10,19 @@ from buildhat.exc import LightError
 class TestLight(unittest.TestCase):
     """Test light functions"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Claim the light once for all tests"""
+        cls._light = Light('A')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the light's port"""
+        del cls._light
+
     def test_light(self):
         """Test light functions"""
-        light = Light('A')
+        light = self._light
         light.on()
         light.brightness(0)
         light.brightness(100)
@@ -2,54 +2,99 @@
 
 import time
 import unittest
+from array import array
 
 from buildhat import Matrix
 from buildhat.exc import MatrixError
 
 
+def _grid(pixel, width=3, height=3):
+    """Build a grid filled with a single pixel"""
+    return [[pixel] * width for _ in range(height)]
+
+
+# Only invalid grids are shared: set_pixels normalises valid grids in place
+# and keeps a reference to them, so those are built at each call site
+TALL = _grid((10, 10), height=4)
+WIDE = _grid((10, 10), width=4)
+COLOR_HIGH = _grid((11, 10))
+COLOR_LOW = _grid((-1, 10))
+BRIGHT_HIGH = _grid((10, 11))
+BRIGHT_LOW = _grid((10, -1))
+COLOR_NAME = _grid(("gold", 10))
+BRIGHT_STR = _grid((10, "test"))
+
+
 class TestMatrix(unittest.TestCase):
     """Test matrix functions"""
 
+    BAD_GRIDS = (TALL, WIDE, COLOR_HIGH, COLOR_LOW, BRIGHT_HIGH, BRIGHT_LOW, COLOR_NAME, BRIGHT_STR)
+    BAD_PIXELS = (("gold", 10), (10, -1), (10, 11), (-1, 10), (11, 10))
+    BAD_SET_PIXEL = (((-1, 0), ("red", 10)),
+                     ((0, -1), ("red", 10)),
+                     ((3, 0), ("red", 10)),
+                     ((0, 3), ("red", 10)),
+                     ((0, 0), ("gold", 10)),
+                     ((0, 0), ("red", -1)),
+                     ((0, 0), ("red", 11)))
+
+    @classmethod
+    def setUpClass(cls):
+        """Claim the matrix once for all tests"""
+        cls._matrix = Matrix('A')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the matrix's port"""
+        del cls._matrix
+
     def test_matrix(self):
         """Test setting matrix pixels"""
-        matrix = Matrix('A')
-        matrix.set_pixels([[(10, 10) for x in range(3)] for y in range(3)])
+        matrix = self._matrix
+        matrix.set_pixels(_grid((10, 10)))
+        time.sleep(1)
+        for bad in self.BAD_GRIDS:
+            with self.subTest(grid=bad):
+                self.assertRaises(MatrixError, matrix.set_pixels, bad)
+        matrix.set_pixels(_grid(("pink", 10)))
+        time.sleep(1)
+
+    def test_pixels_raw(self):
+        """Test setting matrix pixels from packed bytes"""
+        matrix = self._matrix
+        matrix.set_pixels_raw(b"\x0a\x0a" * 9)
         time.sleep(1)
-        self.assertRaises(MatrixError, matrix.set_pixels, [[(10, 10) for x in range(3)] for y in range(4)])
-        self.assertRaises(MatrixError, matrix.set_pixels, [[(10, 10) for x in range(4)] for y in range(3)])
-        self.assertRaises(MatrixError, matrix.set_pixels, [[(11, 10) for x in range(3)] for y in range(3)])
-        self.assertRaises(MatrixError, matrix.set_pixels, [[(-1, 10) for x in range(3)] for y in range(3)])
-        self.assertRaises(MatrixError, matrix.set_pixels, [[(10, 11) for x in range(3)] for y in range(3)])
-        self.assertRaises(MatrixError, matrix.set_pixels, [[(10, -1) for x in range(3)] for y in range(3)])
-        self.assertRaises(MatrixError, matrix.set_pixels, [[("gold", 10) for x in range(3)] for y in range(3)])
-        self.assertRaises(MatrixError, matrix.set_pixels, [[(10, "test") for x in range(3)] for y in range(3)])
-        matrix.set_pixels([[("pink", 10) for x in range(3)] for y in range(3)])
+        matrix.set_pixels_raw(bytearray([3, 10] * 9))
         time.sleep(1)
+        self.assertRaises(MatrixError, matrix.set_pixels_raw, b"\x0a\x0a" * 8)
+        self.assertRaises(MatrixError, matrix.set_pixels_raw, b"\x0b\x0a" * 9)
+        self.assertRaises(MatrixError, matrix.set_pixels_raw, b"\x0a\x0b" * 9)
+        self.assertRaises(MatrixError, matrix.set_pixels_raw, [10] * 18)
+        self.assertRaises(MatrixError, matrix.set_pixels_raw, array('H', [0x0a0a] * 9))
+        self.assertRaises(MatrixError, matrix.set_pixels_raw, memoryview(bytes(36))[::2])
 
     def test_clear(self):
         """Test clearing matrix"""
-        matrix = Matrix('A')
+        matrix = self._matrix
         matrix.clear()
         matrix.clear((10, 10))
         time.sleep(1)
         matrix.clear(("yellow", 10))
         time.sleep(1)
-        self.assertRaises(MatrixError, matrix.clear, ("gold", 10))
-        self.assertRaises(MatrixError, matrix.clear, (10, -1))
-        self.assertRaises(MatrixError, matrix.clear, (10, 11))
-        self.assertRaises(MatrixError, matrix.clear, (-1, 10))
-        self.assertRaises(MatrixError, matrix.clear, (10, 11))
+        for bad in self.BAD_PIXELS:
+            with self.subTest(pixel=bad):
+                self.assertRaises(MatrixError, matrix.clear, bad)
 
     def test_transition(self):
         """Test transitions"""
-        matrix = Matrix('A')
+        matrix = self._matrix
         matrix.clear(("green", 10))
         time.sleep(1)
         matrix.set_transition(1)
-        matrix.set_pixels([[("blue", 10) for x in range(3)] for y in range(3)])
+        matrix.set_pixels(_grid(("blue", 10)))
         time.sleep(4)
         matrix.set_transition(2)
-        matrix.set_pixels([[("red", 10) for x in range(3)] for y in range(3)])
+        matrix.set_pixels(_grid(("red", 10)))
         time.sleep(4)
         matrix.set_transition(0)
         self.assertRaises(MatrixError, matrix.set_transition, -1)
@@ -58,7 +103,7 @@ class TestMatrix(unittest.TestCase):
 
     def test_level(self):
         """Test level"""
-        matrix = Matrix('A')
+        matrix = self._matrix
         matrix.clear(("orange", 10))
         time.sleep(1)
         matrix.level(5)
@@ -69,18 +114,14 @@ class TestMatrix(unittest.TestCase):
 
     def test_pixel(self):
         """Test pixel"""
-        matrix = Matrix('A')
+        matrix = self._matrix
         matrix.clear()
         matrix.set_pixel((0, 0), ("red", 10))
         matrix.set_pixel((2, 2), ("red", 10))
         time.sleep(1)
-        self.assertRaises(MatrixError, matrix.set_pixel, (-1, 0), ("red", 10))
-        self.assertRaises(MatrixError, matrix.set_pixel, (0, -1), ("red", 10))
-        self.assertRaises(MatrixError, matrix.set_pixel, (3, 0), ("red", 10))
-        self.assertRaises(MatrixError, matrix.set_pixel, (0, 3), ("red", 10))
-        self.assertRaises(MatrixError, matrix.set_pixel, (0, 0), ("gold", 10))
-        self.assertRaises(MatrixError, matrix.set_pixel, (0, 0), ("red", -1))
-        self.assertRaises(MatrixError, matrix.set_pixel, (0, 0), ("red", 11))
+        for coord, pixel in self.BAD_SET_PIXEL:
+            with self.subTest(coord=coord, pixel=pixel):
+                self.assertRaises(MatrixError, matrix.set_pixel, coord, pixel)
 
 
 if __name__ == '__main__':
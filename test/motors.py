@@ -1,5 +1,6 @@
 """Test motors"""
 
+import os
 import time
 import unittest
 
@@ -7,14 +8,41 @@ from buildhat import Hat, Motor
 from buildhat.exc import DeviceError, MotorError
 
 
+def setUpModule():
+    """Set up the hat with debug logging when BUILDHAT_DEBUG is set
+
+    This has to happen before any device is created, as later Hat() calls
+    reuse the existing connection
+    """
+    if os.environ.get("BUILDHAT_DEBUG"):
+        Hat(debug=True)
+
+
 class TestMotor(unittest.TestCase):
     """Test motors"""
 
     THRESHOLD_DISTANCE = 15
 
+    @classmethod
+    def setUpClass(cls):
+        """Claim motor A once for all tests"""
+        cls._motor = Motor('A')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release motor A's port"""
+        del cls._motor
+
+    def setUp(self):
+        """Restore motor settings changed by earlier tests"""
+        self._motor.set_default_speed(20)
+        self._motor.plimit(0.7)
+        self._motor.when_rotated = None
+        self._motor.interval = 10
+
     def test_rotations(self):
         """Test motor rotating"""
-        m = Motor('A')
+        m = self._motor
         pos1 = m.get_position()
         m.run_for_rotations(2)
         pos2 = m.get_position()
@@ -23,7 +51,7 @@ class TestMotor(unittest.TestCase):
 
     def test_nonblocking(self):
         """Test motor nonblocking mode"""
-        m = Motor('A')
+        m = self._motor
         m.set_default_speed(10)
         last = 0
         for delay in [1, 0]:
@@ -44,7 +72,7 @@ class TestMotor(unittest.TestCase):
 
     def test_nonblocking_multiple(self):
         """Test motor nonblocking mode"""
-        m1 = Motor('A')
+        m1 = self._motor
         m1.set_default_speed(10)
         m2 = Motor('B')
         m2.set_default_speed(10)
@@ -74,7 +102,7 @@ class TestMotor(unittest.TestCase):
 
     def test_nonblocking_mixed(self):
         """Test motor nonblocking mode mixed with blocking mode"""
-        m = Motor('A')
+        m = self._motor
         m.run_for_seconds(5, blocking=False)
         m.run_for_degrees(360)
         m.run_for_seconds(5, blocking=False)
@@ -88,7 +116,7 @@ class TestMotor(unittest.TestCase):
 
     def test_position(self):
         """Test motor goes to desired position"""
-        m = Motor('A')
+        m = self._motor
         m.run_to_position(0)
         pos1 = m.get_aposition()
         diff = abs((0 - pos1 + 180) % 360 - 180)
@@ -101,29 +129,29 @@ class TestMotor(unittest.TestCase):
 
     def test_time(self):
         """Test motor runs for correct duration"""
-        m = Motor('A')
-        t1 = time.time()
+        m = self._motor
+        t1 = time.monotonic()
         m.run_for_seconds(5)
-        t2 = time.time()
+        t2 = time.monotonic()
         self.assertEqual(int(t2 - t1), 5)
 
     def test_speed(self):
         """Test setting motor speed"""
-        m = Motor('A')
+        m = self._motor
         m.set_default_speed(50)
         self.assertRaises(MotorError, m.set_default_speed, -101)
         self.assertRaises(MotorError, m.set_default_speed, 101)
 
     def test_plimit(self):
         """Test altering power limit of motor"""
-        m = Motor('A')
+        m = self._motor
         m.plimit(0.5)
         self.assertRaises(MotorError, m.plimit, -1)
         self.assertRaises(MotorError, m.plimit, 2)
 
     def test_pwm(self):
         """Test PWMing motor"""
-        m = Motor('A')
+        m = self._motor
         m.pwm(0.3)
         time.sleep(0.5)
         m.pwm(0)
@@ -132,111 +160,138 @@ class TestMotor(unittest.TestCase):
 
     def test_callback(self):
         """Test setting callback"""
-        m = Motor('A')
+        m = self._motor
+        count = 0
 
         def handle_motor(speed, pos, apos):
-            handle_motor.evt += 1
-        handle_motor.evt = 0
+            nonlocal count
+            count += 1
         m.when_rotated = handle_motor
         m.run_for_seconds(1)
-        self.assertGreater(handle_motor.evt, 0)
+        self.assertGreater(count, 0)
 
     def test_callback_interval(self):
         """Test setting callback and interval"""
-        m = Motor('A')
+        m = self._motor
         m.interval = 10
+        count = 0
 
         def handle_motor(speed, pos, apos):
-            handle_motor.evt += 1
-        handle_motor.evt = 0
+            nonlocal count
+            count += 1
         m.when_rotated = handle_motor
         m.run_for_seconds(5)
-        self.assertGreater(handle_motor.evt, 0.8 * ((1 / ((m.interval) * 1e-3)) * 5))
+        self.assertGreater(count, 0.8 * ((1 / ((m.interval) * 1e-3)) * 5))
 
     def test_none_callback(self):
         """Test setting empty callback"""
-        m = Motor('A')
+        m = self._motor
         m.when_rotated = None
         m.start()
         time.sleep(0.5)
         m.stop()
 
-    def test_duplicate_port(self):
-        """Test using same port for motor"""
-        m1 = Motor('A')  # noqa: F841
-        self.assertRaises(DeviceError, Motor, 'A')
+    def test_interval(self):
+        """Test motor interval"""
+        m = self._motor
+        m.interval = 10
+        count = 1000
+        expected_dur = count * m.interval * 1e-3
+        start = time.monotonic()
+        for _ in range(count):
+            m.get_position()
+        end = time.monotonic()
+        diff = abs((end - start) - expected_dur)
+        self.assertLess(diff, expected_dur * 0.1)
+
+    def test_dual_interval(self):
+        """Test dual motor interval"""
+        m1 = self._motor
+        m2 = Motor('B')
+        for interval in [20, 10]:
+            m1.interval = interval
+            m2.interval = interval
+            count = 1000
+            expected_dur = count * m1.interval * 1e-3
+            start = time.monotonic()
+            for _ in range(count):
+                m1.get_position()
+                m2.get_position()
+            end = time.monotonic()
+            diff = abs((end - start) - expected_dur)
+            self.assertLess(diff, expected_dur * 0.1)
 
-    def test_del(self):
-        """Test deleting motor"""
-        m1 = Motor('A')
-        del m1
-        Motor('A')
+
+class TestMotorSoak(unittest.TestCase):
+    """Soak test motors
+
+    Each test runs for BUILDHAT_SOAK_SECS seconds (default 2), the
+    feedback test only runs when BUILDHAT_SOAK is set
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Claim motor A once for all tests"""
+        cls._motor = Motor('A')
+        cls._duration = float(os.environ.get("BUILDHAT_SOAK_SECS", "2"))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release motor A's port"""
+        del cls._motor
 
     def test_continuous_start(self):
-        """Test starting motor for 5mins"""
-        t = time.time() + (60 * 5)
-        m = Motor('A')
+        """Test starting motor repeatedly"""
+        t = time.monotonic() + self._duration
+        m = self._motor
         toggle = 0
-        while time.time() < t:
+        while time.monotonic() < t:
             m.start(toggle)
             toggle ^= 1
+        m.stop()
 
     def test_continuous_degrees(self):
-        """Test setting degrees for 5mins"""
-        t = time.time() + (60 * 5)
-        m = Motor('A')
+        """Test setting degrees repeatedly"""
+        t = time.monotonic() + self._duration
+        m = self._motor
         toggle = 0
-        while time.time() < t:
+        while time.monotonic() < t:
             m.run_for_degrees(toggle)
             toggle ^= 1
 
     def test_continuous_position(self):
-        """Test setting position of motor for 5mins"""
-        t = time.time() + (60 * 5)
-        m = Motor('A')
+        """Test setting position of motor repeatedly"""
+        t = time.monotonic() + self._duration
+        m = self._motor
         toggle = 0
-        while time.time() < t:
+        while time.monotonic() < t:
             m.run_to_position(toggle)
             toggle ^= 1
 
+    @unittest.skipUnless(os.environ.get("BUILDHAT_SOAK"), "set BUILDHAT_SOAK to run")
     def test_continuous_feedback(self):
         """Test feedback of motor for 30mins"""
-        Hat(debug=True)
-        t = time.time() + (60 * 30)
-        m = Motor('A')
+        t = time.monotonic() + (60 * 30)
+        m = self._motor
         m.start(40)
-        while time.time() < t:
+        while time.monotonic() < t:
             _ = (m.get_speed(), m.get_position(), m.get_aposition())
+        m.stop()
 
-    def test_interval(self):
-        """Test motor interval"""
-        m = Motor('A')
-        m.interval = 10
-        count = 1000
-        expected_dur = count * m.interval * 1e-3
-        start = time.time()
-        for _ in range(count):
-            m.get_position()
-        end = time.time()
-        diff = abs((end - start) - expected_dur)
-        self.assertLess(diff, expected_dur * 0.1)
 
-    def test_dual_interval(self):
-        """Test dual motor interval"""
+class TestMotorPort(unittest.TestCase):
+    """Test claiming and releasing a motor's port"""
+
+    def test_duplicate_port(self):
+        """Test using same port for motor"""
+        m1 = Motor('A')  # noqa: F841
+        self.assertRaises(DeviceError, Motor, 'A')
+
+    def test_del(self):
+        """Test deleting motor"""
         m1 = Motor('A')
-        m2 = Motor('B')
-        for interval in [20, 10]:
-            m1.interval = interval
-            m2.interval = interval
-            count = 1000
-            expected_dur = count * m1.interval * 1e-3
-            start = time.time()
-            for _ in range(count):
-                m1.get_position()
-                m2.get_position()
-            end = time.time()
-            diff = abs((end - start) - expected_dur)
-            self.assertLess(diff, expected_dur * 0.1)
+        del m1
+        Motor('A')
 
 
 if __name__ == '__main__':